@@ -1,22 +1,35 @@
 #!/usr/bin/env python3
 
 import logging
+import os
 import sys
 import time
 import subprocess
 import signal
+import threading
 import argparse
 import redis
 from decouple import Config, RepositoryEnv, RepositoryEmpty
-from datetime import datetime, timedelta
-from prometheus_client import start_http_server, CollectorRegistry, Gauge, write_to_textfile, generate_latest
-from prometheus_client.parser import text_string_to_metric_families
+from datetime import datetime
+from prometheus_client import start_http_server, CollectorRegistry, Gauge, generate_latest
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+
+class SplitStreamHandler(logging.StreamHandler):
+    """
+    A stream handler that routes records below ERROR to stdout and the rest to stderr.
+
+    Using a single handler keeps every record formatted and written exactly once.
+    """
+    def emit(self, record):
+        self.stream = sys.stderr if record.levelno >= logging.ERROR else sys.stdout
+        super().emit(record)
 
 
 class MyLogger:
     """
-    A simple wrapper around Python's logging module to set up loggers with stdout and stderr handlers.
+    A simple wrapper around Python's logging module to set up loggers with a stdout/stderr handler.
 
     Parameters:
         name (str): The name of the logger.
@@ -25,15 +38,12 @@ class MyLogger:
     def __init__(self, name: str, level=logging.INFO):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
+        if self.logger.handlers:
+            return
         formatter = logging.Formatter('%(asctime)s %(name)s %(levelname)s: %(message)s')
-        stdout_handler = logging.StreamHandler(sys.stdout)
-        stdout_handler.setLevel(logging.INFO)
-        stdout_handler.setFormatter(formatter)
-        stderr_handler = logging.StreamHandler(sys.stderr)
-        stderr_handler.setLevel(logging.ERROR)
-        stderr_handler.setFormatter(formatter)
-        self.logger.addHandler(stdout_handler)
-        self.logger.addHandler(stderr_handler)
+        handler = SplitStreamHandler(sys.stdout)
+        handler.setFormatter(formatter)
+        self.logger.addHandler(handler)
 
 
 class Decouwrapper:
@@ -58,10 +68,11 @@ class Decouwrapper:
         """
         parser = argparse.ArgumentParser(description='AWG exporter options')
         parser.add_argument('--envfile', type=str, help='Path to config.env file')
-        if parser.parse_args().envfile is None:
+        args = parser.parse_args()
+        if args.envfile is None:
             repository = RepositoryEmpty()
         else:
-            repository = RepositoryEnv(parser.parse_args().envfile)
+            repository = RepositoryEnv(args.envfile)
         self.__config = Config(repository)
 
     def __call__(self, *args, **kwargs):
@@ -89,9 +100,10 @@ class PersistenceWrapper:
         online (int): Users currently online (last 5 minutes).
     """
 
-    FIVE_MINUTES = timedelta(minutes=5)
-    ONE_DAY = timedelta(days=1)
-    ONE_MONTH = timedelta(days=30)
+    FIVE_MINUTES = 5 * 60
+    ONE_DAY = 24 * 60 * 60
+    ONE_MONTH = 30 * 24 * 60 * 60
+    PEERS_KEY = 'peers_last_seen'
 
     def __init__(self, host: str, port: int, db: int):
         """
@@ -103,63 +115,99 @@ class PersistenceWrapper:
             db (int): Redis database number. Defaults to 0.
         """
         self.log = MyLogger(self.__class__.__name__).logger
-        self.connection = redis.Redis(host=host, port=port, db=db, decode_responses=True)
+        pool = redis.BlockingConnectionPool(host=host, port=port, db=db, max_connections=16, timeout=5,
+                                            socket_keepalive=True, decode_responses=True)
+        self.connection = redis.Redis(connection_pool=pool)
         self.log.info('Redis storage initialized')
         self.dau: int = 0
         self.mau: int = 0
         self.mau_abs: int = 0
         self.online: int = 0
         self.current_month: str = ''
+        self._dirty = False
+        self._last_recalc = 0.0
+        self._month_key = None
+        self._month_start = 0.0
+        self._migrate_flat_keys()
 
-    def update_peer(self, peer: str, handshake_time: int) -> None:
+    def _migrate_flat_keys(self) -> None:
         """
-        Updates the last handshake time for a specific peer in Redis.
+        One-time migration from the old one-key-per-peer layout.
+
+        Earlier versions stored each peer as a flat string key holding its handshake
+        timestamp. Moves any such leftover keys into the peers sorted set and deletes
+        them, so upgraded deployments keep their recent activity (and do not leak
+        TTL-less keys forever).
+        """
+        try:
+            keys = [key for key in self.connection.scan_iter(count=1000) if key != self.PEERS_KEY]
+            if not keys:
+                return
+            handshakes = {}
+            for key, value in zip(keys, self.connection.mget(keys)):
+                try:
+                    handshakes[key] = float(value)
+                except (TypeError, ValueError):
+                    continue  # not a legacy peer key, leave it alone
+            if not handshakes:
+                return
+            pipe = self.connection.pipeline(transaction=False)
+            pipe.zadd(self.PEERS_KEY, handshakes)
+            pipe.delete(*handshakes.keys())
+            pipe.execute()
+            self._dirty = True
+            self.log.info(f"Migrated {len(handshakes)} legacy peer keys into {self.PEERS_KEY}")
+        except redis.RedisError as e:
+            self.log.error(f"Error migrating legacy peer keys: {e}")
+
+    def update_peers(self, peers: dict) -> None:
+        """
+        Updates the last handshake times for a batch of peers in one Redis call.
 
         Args:
-            peer (str): Unique identifier for the peer.
-            handshake_time (int): Timestamp of the handshake event.
+            peers (dict): Mapping of peer identifiers to handshake timestamps.
         """
+        if not peers:
+            return
         try:
-            self.connection.set(peer, handshake_time)
+            self.connection.zadd(self.PEERS_KEY, peers)
+            self._dirty = True
         except redis.RedisError as e:
-            self.log.error(f"Error updating peer {peer}: {e}")
+            self.log.error(f"Error updating peers: {e}")
 
     def recalculate(self) -> None:
         """
-        Recalculates the MAU, DAU, and online user counts by iterating over all peer entries
-        in Redis and comparing their handshake times to current time thresholds.
+        Recalculates the MAU, DAU, and online user counts by counting members of the
+        peers sorted set whose handshake times fall within the current time thresholds.
 
         MAU (Monthly Active Users): Users active within the last 30 days.
         DAU (Daily Active Users): Users active within the last 24 hours.
         Online: Users active within the last 5 minutes.
+
+        When no handshake arrived since the previous pass, the cached counters are
+        kept for up to five minutes (the resolution of the online window) before
+        the counts are refreshed.
         """
         try:
             now = datetime.now()
-            five_minutes_ago = (now - self.FIVE_MINUTES).timestamp()
-            day_ago = (now - self.ONE_DAY).timestamp()
-            month_ago = (now - self.ONE_MONTH).timestamp()
-            first_day_of_month = datetime(now.year, now.month, 1).timestamp()
-            mau_abs_count = 0
-            mau_count = 0
-            dau_count = 0
-            online_count = 0
-            for peer in self.connection.keys():
-                handshake_time = self.connection.get(peer)
-                if handshake_time:
-                    handshake_time = float(handshake_time)
-                    if handshake_time >= first_day_of_month:
-                        mau_abs_count += 1
-                    if handshake_time >= month_ago:
-                        mau_count += 1
-                    if handshake_time >= day_ago:
-                        dau_count += 1
-                    if handshake_time >= five_minutes_ago:
-                        online_count += 1
-            self.mau_abs = mau_abs_count
-            self.mau = mau_count
-            self.dau = dau_count
-            self.online = online_count
-            self.current_month = f"{now.strftime('%Y')}-{now.strftime('%m')}"
+            now_ts = now.timestamp()
+            if not self._dirty and now_ts - self._last_recalc < self.FIVE_MINUTES:
+                return
+            month_key = (now.year, now.month)
+            if month_key != self._month_key:
+                self._month_key = month_key
+                self._month_start = datetime(now.year, now.month, 1).timestamp()
+                self.current_month = now.strftime('%Y-%m')
+            month_ago = now_ts - self.ONE_MONTH
+            pipe = self.connection.pipeline(transaction=False)
+            pipe.zcount(self.PEERS_KEY, self._month_start, '+inf')
+            pipe.zcount(self.PEERS_KEY, month_ago, '+inf')
+            pipe.zcount(self.PEERS_KEY, now_ts - self.ONE_DAY, '+inf')
+            pipe.zcount(self.PEERS_KEY, now_ts - self.FIVE_MINUTES, '+inf')
+            pipe.zremrangebyscore(self.PEERS_KEY, '-inf', min(month_ago, self._month_start))
+            self.mau_abs, self.mau, self.dau, self.online, _ = pipe.execute()
+            self._dirty = False
+            self._last_recalc = now_ts
         except redis.RedisError as e:
             self.log.error(f"Error recalculating active users: {e}")
 
@@ -171,54 +219,76 @@ class AwgShowWrapper:
     This class includes static methods for parsing text blocks into structured data and running 'awg show' commands.
 
     Attributes:
-        None
+        log (Logger): Class-wide logger, created once at import time.
     """
 
+    log = MyLogger('AwgShowWrapper').logger
+
     @staticmethod
-    def parse(text_block: str) -> list:
+    def parse_stream(lines) -> object:
         """
-        Parse a text block containing information about AmneziaWG peers into a list of dictionaries.
+        Parse lines of 'awg show all dump' output into (peer, latest_handshake) tuples as they arrive.
+
+        Dump output is tab-delimited with a fixed column layout: a 5-column device
+        line per interface followed by 9-column peer lines. Device lines are skipped
+        by their column count, so output covering several interfaces parses correctly.
+        Peers are yielded one by one, so the full output never has to be held in
+        memory at once.
 
         Args:
-            text_block (str): The text block to parse.
+            lines: An iterable of output lines (e.g. the stdout of a running process).
+
+        Yields:
+            tuple: A (peer, latest_handshake) pair.
         """
-        lines = text_block.strip().splitlines()
-        peers = []
-        for line in lines[1:]:  # exclude 1st line with host data
-            parts = line.split()
-            current_peer = {}
+        for line in lines:
+            parts = line.split('\t', 6)
             if len(parts) >= 6:
-                current_peer['peer'] = parts[4]
-                current_peer['latest_handshake'] = parts[5]
-                peers.append(current_peer)
-
-        return peers
+                yield parts[4], parts[5]
 
     @staticmethod
-    def run_bin(command: list) -> str:
+    def run_bin_stream(command: list):
         """
-        Run an 'awg show' command (or its replacement) and return the output.
+        Start an 'awg show' command (or its replacement) and return the running process.
+
+        The caller is expected to consume the process stdout (e.g. via parse_stream)
+        and wait for it to finish.
 
         Args:
             command (list): The 'awg show' command to run.
 
         Returns:
-            str: The output of the 'awg show' command.
+            subprocess.Popen: The running process, or None if it could not be started.
         """
-        log = MyLogger('AwgShowWrapper').logger
         try:
-            process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True)
-            return process.stdout.strip()
-        except subprocess.CalledProcessError as e:
-            log.error(f"Error: Subprocess failed with exit code {e.returncode} and stderr: {e.stderr.strip()}")
-            return ''
+            # New session: the process leads its own group, so kill_process_group
+            # can take down wrapper scripts together with their children.
+            return subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                    start_new_session=True)
         except FileNotFoundError as e:
-            log.error(f"{e}")
-            log.error('Cannot execute awg binary because of the previous exception. Exporter will not work as expected.')
-            return ''
+            AwgShowWrapper.log.error(f"{e}")
+            AwgShowWrapper.log.error('Cannot execute awg binary because of the previous exception. Exporter will not work as expected.')
+            return None
         except Exception as e:
-            log.error(f"{e}")
-            return ''
+            AwgShowWrapper.log.error(f"{e}")
+            return None
+
+    @staticmethod
+    def kill_process_group(process) -> None:
+        """
+        Kills the whole process group of a process started by run_bin_stream.
+
+        AWG_EXPORTER_AWG_SHOW_EXEC may point at a wrapper script whose children
+        inherit the stdout pipe; killing only the wrapper would leave them holding
+        the pipe open and the read loop blocked.
+
+        Args:
+            process (subprocess.Popen): The process to kill.
+        """
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            process.kill()
 
 
 class Exporter:
@@ -245,6 +315,20 @@ class Exporter:
         """
         self.config = config
         self.awg_show_command = self.config['awg_executable'].split(' ')
+        self.awg_timeout = self.config['awg_timeout']
+        self.ops_mode = self.config['ops_mode']
+        self.scrape_interval = self.config['scrape_interval']
+        self.metrics_file = self.config['metrics_file']
+        self.http_port = self.config['http_port']
+        self.addr = self.config['addr']
+        self.grafana_write_url = self.config['grafana_write_url']
+        self.grafana_write_token = self.config['grafana_write_token']
+        self.grafana_additional_labels = self.config['grafana_additional_labels']
+        self.http = requests.Session()
+        self.http.headers.update({"Authorization": f"Bearer {self.grafana_write_token}", "Content-Type": "text/plain"})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=Retry(total=3, backoff_factor=0.2))
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
         self.log = MyLogger(self.__class__.__name__).logger
         self.registry = CollectorRegistry()
         self.storage = PersistenceWrapper(self.config['redis_host'], self.config['redis_port'], self.config['redis_db'])
@@ -252,7 +336,11 @@ class Exporter:
         self.dau_metric = Gauge('awg_dau', 'Daily active users', registry=self.registry)
         self.mau_metric = Gauge('awg_mau', 'Monthly active users', registry=self.registry)
         self.mau_abs_metric = Gauge('awg_mau_abs', 'Monthly active users (Absolute)', ['month'], registry=self.registry)
+        self._mau_abs_child = None
+        self._mau_abs_month = ''
+        self._mau_abs_old_months = []
         self.status = Gauge('awg_status', 'Exporter status. 1 - OK, 0 - not OK', registry=self.registry)
+        self._stop = threading.Event()
         self.log.info('AmneziaWG exporter initialized')
 
     def sigterm_handler(self, sig, frame) -> None:
@@ -260,34 +348,67 @@ class Exporter:
         Handles SIGTERM signal for graceful shutdown.
         """
         self.log.info('SIGTERM received, preparing to shut down...')
-        sys.exit(0)
+        self._stop.set()
 
     def sigint_handler(self, sig, frame) -> None:
         """
         Handles SIGINT (Ctrl+C) signal for graceful shutdown.
         """
         self.log.info('SIGINT (Ctrl+C) received, preparing to shut down...')
-        sys.exit(0)
+        self._stop.set()
 
     def update_metrics(self) -> None:
         """
         Updates and recalculates metrics for online, daily, and monthly active users.
         """
         try:
-            awg_show_result = AwgShowWrapper.run_bin(self.awg_show_command)
-            peers = AwgShowWrapper.parse(awg_show_result)
-            if not peers:
+            process = AwgShowWrapper.run_bin_stream(self.awg_show_command)
+            if process is None:
                 self.status.set(0)
                 self.current_online_metric.set(0)
                 return
-            for peer in peers:
-                if peer.get('latest_handshake') == "0":
-                    continue
-                self.storage.update_peer(peer['peer'], peer['latest_handshake'])
+            peer_count = 0
+            handshakes = {}
+            # Kill awg if it does not finish within the timeout, so a hung binary
+            # cannot block the scrape loop (and shutdown) indefinitely.
+            watchdog = threading.Timer(self.awg_timeout, AwgShowWrapper.kill_process_group, args=(process,))
+            watchdog.start()
+            # Drain stderr on a separate thread: reading it only after stdout hits
+            # EOF would deadlock once awg fills the stderr pipe buffer.
+            stderr_chunks = []
+            stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+            stderr_reader.start()
+            try:
+                for peer, latest_handshake in AwgShowWrapper.parse_stream(process.stdout):
+                    peer_count += 1
+                    if latest_handshake == "0":
+                        continue
+                    handshakes[peer] = latest_handshake
+                stderr_reader.join()
+                stderr = stderr_chunks[0] if stderr_chunks else ''
+            finally:
+                watchdog.cancel()
+            if process.wait() != 0:
+                self.log.error(f"Error: Subprocess failed with exit code {process.returncode} and stderr: {stderr.strip()}")
+                peer_count = 0
+            if peer_count == 0:
+                self.status.set(0)
+                self.current_online_metric.set(0)
+                return
+            self.storage.update_peers(handshakes)
             self.storage.recalculate()
             self.dau_metric.set(self.storage.dau)
             self.mau_metric.set(self.storage.mau)
-            self.mau_abs_metric.labels(self.storage.current_month).set(self.storage.mau_abs)
+            if self.storage.current_month != self._mau_abs_month:
+                if self._mau_abs_month:
+                    self._mau_abs_old_months.append(self._mau_abs_month)
+                # Keep the previous month's final value around, drop anything older
+                # so the registry does not grow a series per month of uptime.
+                while len(self._mau_abs_old_months) > 1:
+                    self.mau_abs_metric.remove(self._mau_abs_old_months.pop(0))
+                self._mau_abs_child = self.mau_abs_metric.labels(self.storage.current_month)
+                self._mau_abs_month = self.storage.current_month
+            self._mau_abs_child.set(self.storage.mau_abs)
             self.current_online_metric.set(self.storage.online)
             self.status.set(1)
         except Exception as e:
@@ -297,31 +418,43 @@ class Exporter:
         """
         Sends collected metrics to Grafana Cloud.
         """
-        metrics = generate_latest(self.registry)
-        for family in text_string_to_metric_families(metrics.decode('utf-8')):
+        lines = []
+        for family in self.registry.collect():
             for sample in family.samples:
                 name = sample.name
                 labels = sample.labels
                 value = sample.value
-                labels_string = ','.join([f"{key}={value}" for key, value in labels.items()])
+                labels_string = ','.join(f"{k}={v}" for k, v in labels.items()) if labels else ''
                 # Dirty hack: We might need to add some labels (usually Prometheus does this for us).
-                if self.config['grafana_additional_labels'] != '':
-                    labels_string = f"{labels_string},{self.config['grafana_additional_labels']}"
-                response = requests.post(self.config['grafana_write_url'],
-                                         headers={"Authorization": f"Bearer {self.config['grafana_write_token']}", "Content-Type": "text/plain"},
-                                         data=f"{name},{labels_string} value={value}")
-                if response.status_code != 204:
-                    self.log.info(f"Failed to send metrics to Grafana Cloud: {response.status_code}, {response.text}")
+                if self.grafana_additional_labels != '':
+                    labels_string = f"{labels_string},{self.grafana_additional_labels}"
+                lines.append(f"{name},{labels_string} value={value}")
+        response = self.http.post(self.grafana_write_url, data='\n'.join(lines), timeout=5)
+        if response.status_code != 204:
+            self.log.info(f"Failed to send metrics to Grafana Cloud: {response.status_code}, {response.text}")
+
+    def write_metrics_file(self) -> None:
+        """
+        Writes the current metrics to the metrics file with one write syscall and
+        an atomic rename, so readers never observe a partially written file.
+        """
+        tmp_path = f"{self.metrics_file}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, generate_latest(self.registry))
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.metrics_file)
 
     def validate(self) -> None:
         """
         Validates the configuration, ensuring required fields are set for Grafana Cloud mode.
         """
-        if self.config['ops_mode'] == 'grafana_cloud':
-            if self.config['grafana_write_url'] == '':
+        if self.ops_mode == 'grafana_cloud':
+            if self.grafana_write_url == '':
                 self.log.error('AWG_GRAFANA_WRITE_URL variable must be set!')
                 sys.exit(1)
-            if self.config['grafana_write_token'] == '':
+            if self.grafana_write_token == '':
                 self.log.error('AWG_GRAFANA_WRITE_TOKEN variable must be set!')
                 sys.exit(1)
 
@@ -330,23 +463,50 @@ class Exporter:
         signal.signal(signal.SIGTERM, self.sigterm_handler)
         signal.signal(signal.SIGINT, self.sigint_handler)
         self.validate()
-        if self.config['ops_mode'] == 'http':
+        if self.ops_mode == 'http':
             # Start up the server to expose the metrics.
-            start_http_server(port=self.config['http_port'], addr=self.config['addr'], registry=self.registry)
-        while True:
+            start_http_server(port=self.http_port, addr=self.addr, registry=self.registry)
+        backoff = 0
+        seen_errors = set()
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
             try:
                 self.update_metrics()
-                if self.config['ops_mode'] in ['metricsfile', 'oneshot']:
-                    write_to_textfile(self.config['metrics_file'], self.registry)
-                if self.config['ops_mode'] == 'oneshot':
+                if self.ops_mode in ['metricsfile', 'oneshot']:
+                    self.write_metrics_file()
+                if self.ops_mode == 'oneshot':
                     self.log.info("Exiting after successful metrics fetch...")
                     break
-                if self.config['ops_mode'] == 'grafana_cloud':
+                if self.ops_mode == 'grafana_cloud':
                     self.send_to_grafana_cloud()
-                time.sleep(self.config['scrape_interval'])
+                backoff = 0
+                # Schedule against a monotonic deadline so the cadence does not
+                # drift by however long the scrape itself took.
+                next_tick += self.scrape_interval
+                sleep_for = next_tick - time.monotonic()
+                if sleep_for < 0:
+                    next_tick = time.monotonic()
+                    sleep_for = 0
+                if self._stop.wait(sleep_for):
+                    break
+            except (requests.RequestException, redis.RedisError) as e:
+                # Transient network trouble: retry with exponential backoff instead
+                # of burning a full scrape interval per attempt.
+                backoff = min(backoff * 2, 300) if backoff else 5
+                self.log.error(f"Transient error, retrying in {backoff}s: {e}")
+                next_tick = time.monotonic() + backoff
+                if self._stop.wait(backoff):
+                    break
             except Exception as e:
-                self.log.error(f"{str(e)}")
-                time.sleep(self.config['scrape_interval'])
+                if type(e).__name__ not in seen_errors:
+                    seen_errors.add(type(e).__name__)
+                    self.log.exception('Unexpected error in main loop')
+                else:
+                    self.log.error(f"{str(e)}")
+                next_tick = time.monotonic() + self.scrape_interval
+                if self._stop.wait(self.scrape_interval):
+                    break
+        self.log.info('Shutting down')
 
 
 if __name__ == '__main__':
@@ -354,8 +514,8 @@ if __name__ == '__main__':
     log.info('Starting AmneziaWG exporter')
     config = Decouwrapper()
     exporter_config = {
-        'scrape_interval': config('AWG_EXPORTER_SCRAPE_INTERVAL', default=60),
-        'http_port': config('AWG_EXPORTER_HTTP_PORT', default=9351),
+        'scrape_interval': config('AWG_EXPORTER_SCRAPE_INTERVAL', default=60, cast=int),
+        'http_port': config('AWG_EXPORTER_HTTP_PORT', default=9351, cast=int),
         'addr': config('AWG_EXPORTER_LISTEN_ADDR', default='0.0.0.0'),
         'metrics_file': config('AWG_EXPORTER_METRICS_FILE', default='/tmp/prometheus/awg.prom'),
         'ops_mode': config('AWG_EXPORTER_OPS_MODE', default='http'),
@@ -363,9 +523,10 @@ if __name__ == '__main__':
         'grafana_write_token': config('AWG_GRAFANA_WRITE_TOKEN', default=''),
         'grafana_additional_labels': config('AWG_GRAFANA_ADDITIONAL_LABELS', default=''),
         'awg_executable': config('AWG_EXPORTER_AWG_SHOW_EXEC', default='awg show all dump'),
+        'awg_timeout': config('AWG_EXPORTER_AWG_TIMEOUT', default=10, cast=int),
         'redis_host': config('AWG_EXPORTER_REDIS_HOST', default='localhost'),
-        'redis_port': config('AWG_EXPORTER_REDIS_PORT', default=6379),
-        'redis_db': config('AWG_EXPORTER_REDIS_DB', default=0)
+        'redis_port': config('AWG_EXPORTER_REDIS_PORT', default=6379, cast=int),
+        'redis_db': config('AWG_EXPORTER_REDIS_DB', default=0, cast=int)
     }
     log.info('Exporter config:')
     for key, value in exporter_config.items():